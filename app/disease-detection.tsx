@@ -5,7 +5,7 @@
 
 import { Ionicons } from "@expo/vector-icons";
 import { router } from "expo-router";
-import React, { useMemo, useState } from "react";
+import React, { useMemo, useRef, useState } from "react";
 import { useTranslation } from "react-i18next";
 import {
   ActivityIndicator,
@@ -22,6 +22,7 @@ import CameraService, { CameraResult } from "../services/cameraService";
 import GeminiDiseaseService from "../services/geminiDiseaseService";
 import PlantNetDiseaseService from "../services/plantNetDiseaseService";
 import { ThemeColors, useTheme } from "../theme/ThemeProvider";
+import { ImageUtils } from "../utils/imageUtils";
 
 // ... Interfaces maintained ...
 interface AnalysisResult {
@@ -64,6 +65,8 @@ export default function DiseaseDetectionScreen() {
   const [analysisResult, setAnalysisResult] = useState<AnalysisResult | null>(null);
   const [diseaseSolutions, setDiseaseSolutions] = useState<DiseaseSolution | null>(null);
   const [isLoadingSolutions, setIsLoadingSolutions] = useState(false);
+  // Last PlantNet result keyed by image content, so re-picking the same photo skips the API
+  const lastAnalysisRef = useRef<{ signature: string; result: AnalysisResult } | null>(null);
 
   // ... (Camera Logic Same as before) ...
   const handleTakePicture = async () => {
@@ -80,37 +83,56 @@ export default function DiseaseDetectionScreen() {
     } catch (error) { Alert.alert(t('common.error'), t('diseaseDetection.errors.pickImage')); }
   };
 
+  const identifyImage = async (image: CameraResult): Promise<AnalysisResult> => {
+    // Camera photos are far larger than PlantNet needs, so shrink before uploading twice
+    const uploadImage = await ImageUtils.downscaleForUpload(image);
+    const images = [{ uri: uploadImage.uri }];
+
+    // 1 & 2. Identify Plant Species and Diseases in parallel
+    console.log('🌿 Identifying plant species and diseases...');
+    const [plantResponse, diseaseResponse] = await Promise.all([
+      PlantNetDiseaseService.identifyPlant({ images }),
+      PlantNetDiseaseService.identifyDisease({ images, includeRelatedImages: true }),
+    ]).finally(() => {
+      if (uploadImage.uri !== image.uri) ImageUtils.cleanupTempImages([uploadImage.uri]);
+    });
+
+    let identifiedPlant;
+    if (plantResponse.results && plantResponse.results.length > 0) {
+      const bestPlantMatch = plantResponse.results[0];
+      identifiedPlant = {
+        commonName: bestPlantMatch.species.commonNames?.[0] || bestPlantMatch.species.scientificNameWithoutAuthor,
+        scientificName: bestPlantMatch.species.scientificNameWithoutAuthor,
+        probability: bestPlantMatch.score
+      };
+    }
+
+    const formattedResult = PlantNetDiseaseService.formatHealthSummary(diseaseResponse);
+
+    // 3. Combine Results
+    return {
+      ...formattedResult,
+      identifiedPlant
+    };
+  };
+
   const analyzeDisease = async () => {
-    if (!capturedImage?.base64) return;
+    if (!capturedImage?.uri) return;
     setIsAnalyzing(true);
     console.log('🔍 Starting disease analysis...');
 
     try {
-      // 1. Identify Plant Species
-      console.log('🌿 Identifying plant species...');
-      const plantResponse = await PlantNetDiseaseService.identifyPlantFromBase64([capturedImage.base64]);
-      let identifiedPlant;
-      if (plantResponse.results && plantResponse.results.length > 0) {
-        const bestPlantMatch = plantResponse.results[0];
-        identifiedPlant = {
-          commonName: bestPlantMatch.species.commonNames?.[0] || bestPlantMatch.species.scientificNameWithoutAuthor,
-          scientificName: bestPlantMatch.species.scientificNameWithoutAuthor,
-          probability: bestPlantMatch.score
-        };
+      const signature = await ImageUtils.getImageSignature(capturedImage.uri);
+
+      let combinedResult: AnalysisResult;
+      if (signature && lastAnalysisRef.current?.signature === signature) {
+        console.log('♻️ Image unchanged, reusing previous analysis');
+        combinedResult = lastAnalysisRef.current.result;
+      } else {
+        combinedResult = await identifyImage(capturedImage);
+        lastAnalysisRef.current = signature ? { signature, result: combinedResult } : null;
       }
 
-      // 2. Identify Diseases
-      console.log('🦠 Identifying diseases...');
-      const diseaseResponse = await PlantNetDiseaseService.identifyDiseaseFromBase64([capturedImage.base64], true);
-      const formattedResult = PlantNetDiseaseService.formatHealthSummary(diseaseResponse);
-
-      // 3. Combine Results
-      const combinedResult: AnalysisResult = {
-        ...formattedResult,
-        identifiedPlant
-      };
-
-      console.log('📊 Combined Analysis result:', combinedResult);
       setAnalysisResult(combinedResult);
 
       // Always try to get analysis from Gemini (for any result or general advice)
@@ -119,15 +141,12 @@ export default function DiseaseDetectionScreen() {
       try {
         let diseaseToAnalyze = 'General Plant Health';
         let confidence = 0.5;
-        let isHealthyStatus = formattedResult.isHealthy;
+        let isHealthyStatus = combinedResult.isHealthy;
 
-        if (formattedResult.topDiseases.length > 0) {
-          const topDisease = formattedResult.topDiseases[0];
+        if (combinedResult.topDiseases.length > 0) {
+          const topDisease = combinedResult.topDiseases[0];
           diseaseToAnalyze = topDisease.name;
           confidence = topDisease.probability;
-          console.log('🎯 Analyzing detected issue:', diseaseToAnalyze, 'confidence:', confidence);
-        } else {
-          console.log('📋 No specific diseases detected, providing general care advice');
         }
 
         const solutions = await GeminiDiseaseService.getDiseaseSolutions(
@@ -138,7 +157,6 @@ export default function DiseaseDetectionScreen() {
           i18n.language || 'en'
         );
 
-        console.log('💊 Analysis received:');
         setDiseaseSolutions(solutions);
       } catch (error) {
         console.error('❌ Error getting analysis:', error);
@@ -148,6 +166,7 @@ export default function DiseaseDetectionScreen() {
       }
     } catch (error) {
       console.error('❌ Analysis Error:', error);
+      lastAnalysisRef.current = null;
       Alert.alert(t('diseaseDetection.errors.analysis'), t('diseaseDetection.errors.analysis'));
     } finally {
       setIsAnalyzing(false);
@@ -9,7 +9,6 @@ export interface CameraOptions {
 
 export interface CameraResult {
   uri: string;
-  base64?: string;
   width: number;
   height: number;
   cancelled: boolean;
@@ -47,13 +46,11 @@ class CameraService {
         allowsEditing: options.allowsEditing ?? true,
         aspect: options.aspect ?? [4, 3],
         quality: options.quality ?? 0.8,
-        base64: true,
       });
 
       if (result.canceled || !result.assets || result.assets.length === 0) {
         return {
           uri: "",
-          base64: "",
           width: 0,
           height: 0,
           cancelled: true,
@@ -80,7 +77,6 @@ class CameraService {
 
       return {
         uri: asset.uri,
-        base64: asset.base64 || undefined,
         width: asset.width,
         height: asset.height,
         cancelled: false,
@@ -104,13 +100,11 @@ class CameraService {
         allowsEditing: options.allowsEditing ?? true,
         aspect: options.aspect ?? [4, 3],
         quality: options.quality ?? 0.8,
-        base64: true,
       });
 
       if (result.canceled || !result.assets || result.assets.length === 0) {
         return {
           uri: "",
-          base64: "",
           width: 0,
           height: 0,
           cancelled: true,
@@ -137,7 +131,6 @@ class CameraService {
 
       return {
         uri: asset.uri,
-        base64: asset.base64 || undefined,
         width: asset.width,
         height: asset.height,
         cancelled: false,
@@ -1,4 +1,4 @@
-import { ChatSession, GoogleGenerativeAI } from '@google/generative-ai';
+import { ChatSession, GenerativeModel, GoogleGenerativeAI } from '@google/generative-ai';
 
 export interface ChatMessage {
     id: string;
@@ -12,6 +12,7 @@ class GeminiChatService {
     private static readonly API_KEY = process.env.EXPO_PUBLIC_GEMINI_API_KEY;
     private static genAI: GoogleGenerativeAI | null = null;
     private static chatSession: ChatSession | null = null;
+    private static suggestionModel: GenerativeModel | null = null;
 
     private static getGenAI(): GoogleGenerativeAI {
         if (!this.API_KEY) {
@@ -27,6 +28,14 @@ class GeminiChatService {
         return this.genAI;
     }
 
+    private static getSuggestionModel(): GenerativeModel {
+        if (!this.suggestionModel) {
+            this.suggestionModel = this.getGenAI().getGenerativeModel({ model: 'gemini-2.5-flash' });
+        }
+
+        return this.suggestionModel;
+    }
+
     private static getSystemPrompt(language: string): string {
         const isNepali = language.startsWith('ne');
         const langName = isNepali ? 'Nepali' : 'English';
@@ -92,8 +101,7 @@ Instructions:
      */
     static async getSuggestions(language: string, region: string, month: string): Promise<string[]> {
         try {
-            const genAI = this.getGenAI();
-            const model = genAI.getGenerativeModel({ model: 'gemini-2.5-flash' });
+            const model = this.getSuggestionModel();
 
             const isNepali = language.startsWith('ne');
             const prompt = isNepali
@@ -1,4 +1,4 @@
-import { GoogleGenerativeAI } from '@google/generative-ai';
+import { GenerativeModel, GoogleGenerativeAI } from '@google/generative-ai';
 
 export interface DiseaseSolution {
   diseaseName: string;
@@ -7,10 +7,23 @@ export interface DiseaseSolution {
   summary: string;
 }
 
+export interface HomeRecommendations {
+  title: string;
+  recommendations: string[];
+  tips: string[];
+}
+
 
 class GeminiDiseaseService {
   private static readonly API_KEY = process.env.EXPO_PUBLIC_GEMINI_API_KEY;
   private static genAI: GoogleGenerativeAI | null = null;
+  private static model: GenerativeModel | null = null;
+
+  // Successful responses keyed by request parameters. Offline fallbacks are
+  // never cached so the next call retries the API.
+  private static readonly MAX_CACHE_ENTRIES = 50;
+  private static solutionsCache = new Map<string, DiseaseSolution>();
+  private static recommendationsCache = new Map<string, HomeRecommendations>();
 
   private static getGenAI(): GoogleGenerativeAI {
     if (!this.API_KEY) {
@@ -26,6 +39,31 @@ class GeminiDiseaseService {
     return this.genAI;
   }
 
+  private static getModel(): GenerativeModel {
+    if (!this.model) {
+      this.model = this.getGenAI().getGenerativeModel({ model: 'gemini-2.5-flash' });
+    }
+
+    return this.model;
+  }
+
+  private static getCached<T>(cache: Map<string, T>, key: string): T | undefined {
+    const value = cache.get(key);
+    if (value !== undefined) {
+      // Re-insert so the entry becomes the most recently used
+      cache.delete(key);
+      cache.set(key, value);
+    }
+    return value;
+  }
+
+  private static setCached<T>(cache: Map<string, T>, key: string, value: T): void {
+    if (cache.size >= this.MAX_CACHE_ENTRIES) {
+      cache.delete(cache.keys().next().value as string);
+    }
+    cache.set(key, value);
+  }
+
   /**
    * Gets solutions for a detected plant disease using Gemini AI
    * @param diseaseName - The name of the detected disease
@@ -44,9 +82,15 @@ class GeminiDiseaseService {
   ): Promise<DiseaseSolution> {
     console.log('🔍 Gemini Service: Getting solutions for:', diseaseName, 'on', plantName, 'isHealthy:', isHealthy);
 
+    const cacheKey = [diseaseName, (confidence * 100).toFixed(0), isHealthy, plantName, language].join('|');
+    const cached = this.getCached(this.solutionsCache, cacheKey);
+    if (cached) {
+      console.log('✅ Gemini Service: Using cached solutions');
+      return cached;
+    }
+
     try {
-      const genAI = this.getGenAI();
-      const model = genAI.getGenerativeModel({ model: 'gemini-2.5-flash' });
+      const model = this.getModel();
 
       const healthStatus = isHealthy ? 'healthy' : 'potentially diseased';
       const outputLanguageInstructions = language.startsWith('ne')
@@ -103,7 +147,9 @@ Use simple, conversational language. If the plant appears healthy, focus on gene
       const text = response.text();
       console.log('✅ Gemini Service: Response received');
 
-      return this.parseResponse(text, language, diseaseName);
+      const solution = this.parseResponse(text, language, diseaseName);
+      this.setCached(this.solutionsCache, cacheKey, solution);
+      return solution;
 
     } catch (error) {
       console.warn('⚠️ Gemini Service Unavailable - Using Offline Fallback:', error);
@@ -140,7 +186,7 @@ Use simple, conversational language. If the plant appears healthy, focus on gene
       parsedResponse = JSON.parse(jsonText);
     } catch (parseError) {
       console.error('❌ JSON Parse Error:', parseError);
-      parsedResponse = this.getFallbackResponse(language);
+      throw parseError; // Trigger fallback
     }
 
     return {
@@ -173,16 +219,18 @@ Use simple, conversational language. If the plant appears healthy, focus on gene
     region: string,
     currentMonth: string,
     language: 'en' | 'ne' = 'en'
-  ): Promise<{
-    title: string;
-    recommendations: string[];
-    tips: string[];
-  }> {
+  ): Promise<HomeRecommendations> {
     console.log('🏠 Gemini Home Recommendations: Getting recommendations for region:', region, 'month:', currentMonth, 'language:', language);
 
+    const cacheKey = [region, currentMonth, language].join('|');
+    const cached = this.getCached(this.recommendationsCache, cacheKey);
+    if (cached) {
+      console.log('✅ Gemini Home: Using cached recommendations');
+      return cached;
+    }
+
     try {
-      const genAI = this.getGenAI();
-      const model = genAI.getGenerativeModel({ model: 'gemini-2.5-flash' });
+      const model = this.getModel();
 
       const outputLanguageInstructions = language === 'ne'
         ? 'IMPORTANT: PROVIDE THE ENTIRE RESPONSE IN NEPALI LANGUAGE (Devanagari script).'
@@ -239,11 +287,13 @@ Keep descriptions very concise and actionable.
         throw e; // Trigger fallback
       }
 
-      return {
+      const recommendations: HomeRecommendations = {
         title: parsed.title || (language === 'ne' ? 'कृषि सिफारिसहरू' : 'Farming Recommendations'),
         recommendations: Array.isArray(parsed.recommendations) ? parsed.recommendations : [],
         tips: Array.isArray(parsed.tips) ? parsed.tips : []
       };
+      this.setCached(this.recommendationsCache, cacheKey, recommendations);
+      return recommendations;
 
     } catch (error) {
       console.error('❌ Gemini Home Recommendations Error:', error);
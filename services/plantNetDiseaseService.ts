@@ -1,4 +1,3 @@
-import * as FileSystem from "expo-file-system/legacy";
 import { ImageUtils } from "../utils/imageUtils";
 
 interface PlantNetDiseaseImage {
@@ -143,12 +142,6 @@ class PlantNetDiseaseService {
       // Create form data using React Native's FormData
       const formData = new FormData();
 
-      console.log(
-        "PlantNet Disease API: Starting FormData construction with",
-        request.images.length,
-        "images",
-      );
-
       // Add images to form data
       for (let i = 0; i < request.images.length; i++) {
         const imageData = request.images[i];
@@ -161,11 +154,6 @@ class PlantNetDiseaseService {
           );
         }
 
-        console.log(`PlantNet Disease API: Adding image ${i}:`, {
-          uri: imageData.uri,
-          organ: imageData.organ || "auto",
-        });
-
         // Append image file using correct field name (plural 'images')
         formData.append("images", {
           uri: imageData.uri,
@@ -193,11 +181,6 @@ class PlantNetDiseaseService {
       }
 
       const fullUrl = `${this.API_URL}/identify?${params.toString()}`;
-      console.log("PlantNet Disease API: Making request to:", fullUrl);
-      console.log(
-        "PlantNet Disease API: FormData constructed with fields:",
-        Object.keys(formData),
-      );
 
       // Make API request to diseases identify endpoint
       const apiResponse = await fetch(fullUrl, {
@@ -209,15 +192,6 @@ class PlantNetDiseaseService {
       if (!apiResponse.ok) {
         let errorMessage = `HTTP error! status: ${apiResponse.status}`;
 
-        console.log(
-          "PlantNet Disease API: Error response status:",
-          apiResponse.status,
-        );
-        console.log(
-          "PlantNet Disease API: Error response headers:",
-          apiResponse.headers,
-        );
-
         if (apiResponse.status === 401) {
           errorMessage =
             "Invalid API key. Please check your PlantNet API key configuration.";
@@ -231,7 +205,6 @@ class PlantNetDiseaseService {
         // Try to get more specific error from response body
         try {
           const errorText = await apiResponse.text();
-          console.log("PlantNet Disease API: Error response body:", errorText);
 
           try {
             const errorData = JSON.parse(errorText);
@@ -324,101 +297,6 @@ class PlantNetDiseaseService {
     }
   }
 
-  /**
-   * Identifies plant from base64 string
-   */
-  static async identifyPlantFromBase64(
-    base64Images: string[]
-  ): Promise<any> {
-    const tempImages: { uri: string; organ?: string }[] = [];
-    try {
-      for (let i = 0; i < base64Images.length; i++) {
-        const cleanBase64 = base64Images[i].replace(/^data:image\/[a-z]+;base64,/, "");
-        const tempUri = `${FileSystem.documentDirectory}temp_plant_${i}_${Date.now()}.jpg`;
-        await FileSystem.writeAsStringAsync(tempUri, cleanBase64, { encoding: "base64" as any });
-        tempImages.push({ uri: tempUri });
-      }
-
-      const result = await this.identifyPlant({ images: tempImages });
-
-      for (const tempImage of tempImages) {
-        await FileSystem.deleteAsync(tempImage.uri, { idempotent: true });
-      }
-
-      return result;
-    } catch (error) {
-      for (const tempImage of tempImages) {
-        await FileSystem.deleteAsync(tempImage.uri, { idempotent: true });
-      }
-      throw error;
-    }
-  }
-
-  
-
-  /**
-   * Identifies diseases from base64 image data
-   * @param base64Images - Array of base64 image strings
-   * @param includeRelatedImages - Whether to include related images in response
-   * @returns Promise<PlantNetDiseaseResponse> - The disease identification results
-   */
-  static async identifyDiseaseFromBase64(
-    base64Images: string[],
-    includeRelatedImages: boolean = true,
-  ): Promise<PlantNetDiseaseResponse> {
-    // Convert base64 to temporary files and use the regular identify method
-    const tempImages: { uri: string; organ?: string }[] = [];
-
-    try {
-      for (let i = 0; i < base64Images.length; i++) {
-        const base64String = base64Images[i];
-
-        // Remove data URL prefix if present
-        const cleanBase64 = base64String.replace(
-          /^data:image\/[a-z]+;base64,/,
-          "",
-        );
-
-        // Create temporary file
-        const tempUri = `${FileSystem.documentDirectory}temp_disease_${i}_${Date.now()}.jpg`;
-        await FileSystem.writeAsStringAsync(tempUri, cleanBase64, {
-          encoding: "base64" as any,
-        });
-
-        tempImages.push({
-          uri: tempUri,
-        });
-      }
-
-      // Identify using temporary files
-      const result = await this.identifyDisease({
-        images: tempImages,
-        includeRelatedImages,
-      });
-
-      // Clean up temporary files
-      for (const tempImage of tempImages) {
-        try {
-          await FileSystem.deleteAsync(tempImage.uri, { idempotent: true });
-        } catch {
-          // Ignore cleanup errors
-        }
-      }
-
-      return result;
-    } catch (error) {
-      // Clean up temporary files on error
-      for (const tempImage of tempImages) {
-        try {
-          await FileSystem.deleteAsync(tempImage.uri, { idempotent: true });
-        } catch {
-          // Ignore cleanup errors
-        }
-      }
-      throw error;
-    }
-  }
-
   /**
    * Formats PlantNet disease response into a more user-friendly structure
    * @param response - The raw PlantNet disease API response
@@ -41,6 +41,13 @@ export interface PHData {
   categoryPreference: string;
 }
 
+// Patterns shared by the CSV and sowing period parsers
+const LINE_BREAK_RE = /\r?\n/;
+const BOM_RE = /^\ufeff/;
+const QUOTE_RE = /"/g;
+const PERIOD_SEPARATOR_RE = /[\/,]/;
+const RANGE_DASH_RE = /[-–—−]/; // Hyphen, en dash, em dash and minus sign
+
 /**
  * Helper to load CSV string from asset module
  */
@@ -52,42 +59,130 @@ async function loadCSVAsset(module: any): Promise<string> {
   return await FileSystem.readAsStringAsync(asset.localUri!);
 }
 
+/**
+ * Helper to build a short, stable hash of a string for cache file names
+ */
+function hashString(value: string): string {
+  let hash = 0;
+  for (let i = 0; i < value.length; i++) {
+    hash = (hash * 31 + value.charCodeAt(i)) | 0;
+  }
+  return (hash >>> 0).toString(36);
+}
+
+// Bump when the shape of cached rows changes; old snapshots are then pruned
+const CSV_CACHE_VERSION = 1;
+const CSV_SNAPSHOT_RE = /^csv-v\d+-.+\.json$/;
+
+// Snapshot file names used by the current load; anything else is stale
+const activeCSVSnapshots = new Set<string>();
+
+/**
+ * Helper to load parsed CSV rows from asset module
+ * Parsed rows are snapshotted as JSON in the cache directory, keyed by the
+ * asset hash, so later launches skip the download and the CSV tokenizer.
+ */
+async function loadParsedCSVAsset(module: any, columns?: string[]): Promise<any[]> {
+  const asset = Asset.fromModule(module);
+  const columnsKey = columns ? `-${hashString(columns.join(','))}` : '';
+  const snapshotName = `csv-v${CSV_CACHE_VERSION}-${asset.hash}${columnsKey}.json`;
+  const cacheUri = FileSystem.cacheDirectory && asset.hash
+    ? `${FileSystem.cacheDirectory}${snapshotName}`
+    : null;
+
+  if (cacheUri) {
+    activeCSVSnapshots.add(snapshotName);
+    try {
+      const info = await FileSystem.getInfoAsync(cacheUri);
+      if (info.exists) {
+        return JSON.parse(await FileSystem.readAsStringAsync(cacheUri));
+      }
+    } catch {
+      // Unreadable snapshot, rebuild it from the CSV below
+    }
+  }
+
+  const rows = parseCSV(await loadCSVAsset(module), columns);
+
+  if (cacheUri) {
+    FileSystem.writeAsStringAsync(cacheUri, JSON.stringify(rows)).catch((error) => {
+      console.warn('⚠️ Failed to cache parsed CSV:', error);
+    });
+  }
+
+  return rows;
+}
+
+/**
+ * Helper to delete CSV snapshots left behind by older data or column lists
+ * Must run after every asset has been loaded, so the active set is complete
+ */
+async function pruneCSVSnapshots(): Promise<void> {
+  if (!FileSystem.cacheDirectory) return;
+
+  try {
+    const files = await FileSystem.readDirectoryAsync(FileSystem.cacheDirectory);
+    const stale = files.filter((name) => CSV_SNAPSHOT_RE.test(name) && !activeCSVSnapshots.has(name));
+
+    await Promise.all(stale.map((name) =>
+      FileSystem.deleteAsync(`${FileSystem.cacheDirectory}${name}`, { idempotent: true })
+    ));
+  } catch (error) {
+    console.warn('⚠️ Failed to prune cached CSV snapshots:', error);
+  }
+}
+
+/**
+ * Helper to split a CSV line into trimmed values
+ * Handles quoted values containing commas
+ */
+function splitCSVLine(line: string): string[] {
+  // Fast path: without quotes every comma is a separator
+  if (line.indexOf('"') === -1) {
+    return line.split(',').map((v) => v.trim());
+  }
+
+  const values: string[] = [];
+  let fieldStart = 0;
+  let insideQuotes = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+    if (char === '"') {
+      insideQuotes = !insideQuotes;
+    } else if (char === ',' && !insideQuotes) {
+      values.push(line.slice(fieldStart, i).replace(QUOTE_RE, '').trim());
+      fieldStart = i + 1;
+    }
+  }
+  values.push(line.slice(fieldStart).replace(QUOTE_RE, '').trim());
+
+  return values;
+}
+
 /**
  * Helper to parse CSV string into array of objects
+ * When columns is given, only those columns are copied into each object
  */
-function parseCSV(csvString: string): any[] {
-  const lines = csvString.split(/\r?\n/).filter((line) => line.trim() !== '');
+function parseCSV(csvString: string, columns?: string[]): any[] {
+  const lines = csvString.split(LINE_BREAK_RE).filter((line) => line.trim() !== '');
   if (lines.length === 0) return [];
 
   // Handle BOM and trim headers
-  const headers = lines[0].split(',').map((h) => h.trim().replace(/^\ufeff/, ''));
+  const headers = lines[0].split(',').map((h) => h.trim().replace(BOM_RE, ''));
+  const wanted = headers
+    .map((header, index) => ({ header, index }))
+    .filter(({ header }) => !columns || columns.includes(header));
   const data: any[] = [];
 
-  
   for (let i = 1; i < lines.length; i++) {
-    const currentLine = lines[i];
-    const values: string[] = [];
-    let currentVal = '';
-    let insideQuotes = false;
-
-    // Handle quoted values containing commas
-    for (let char of currentLine) {
-      if (char === '"') {
-        insideQuotes = !insideQuotes;
-      } else if (char === ',' && !insideQuotes) {
-        values.push(currentVal.trim().replace(/^"|"$/g, ''));
-        currentVal = '';
-      } else {
-        currentVal += char;
-      }
-    }
-    values.push(currentVal.trim().replace(/^"|"$/g, ''));
+    const values = splitCSVLine(lines[i]);
 
     if (values.length === headers.length) {
       const obj: any = {};
-      headers.forEach((header, index) => {
+      for (const { header, index } of wanted) {
         obj[header] = values[index];
-      });
+      }
       data.push(obj);
     }
   }
@@ -117,6 +212,28 @@ const agricLimeNE = require('../data/ne_agric_lime.csv');
 const optimalPHNE = require('../data/ne_optimal_ph.csv');
 const vegPHNE = require('../data/ne_veg_ph.csv');
 
+// Columns read by each parse method; anything else in the CSV is dropped at load
+const CSV_COLUMNS = {
+  cropCalendarEN: [
+    'Crop (English)', 'Crop (Nepali)', 'Varieties', 'Spacing (cm)', 'Seed Rate per Ropani',
+    'Suitable Intercrop', 'Crop Rotation Cycle', 'Crop Characteristics', 'Climate Adaptation Techniques'
+  ],
+  cropCalendarNE: [
+    'क्षेत्र', 'बालीको नाम (अंग्रेजी)', 'बालीको नाम', 'जातहरू', 'लगाउने दूरी (से.मि.)',
+    'बीउ दर (प्रति रोपनी)', 'रोप्ने महिना', 'जलवायु अनुकूलन/उत्थानशीलता'
+  ],
+  chemicalFertilizer: [
+    'Fertilizer Name', 'N%', 'P2O5%', 'K2O%', 'Zinc%', 'Sulphur%',
+    'मलको नाम', 'नाइट्रोजन %', 'फस्फोरस %', 'पोटास %', 'जिंक %', 'सल्फर %'
+  ],
+  regionalFertilizer: [
+    'Region', 'Compost/FYM (ton/ha)', 'Urea (kg/kattha)', 'DAP (kg/kattha)', 'MoP (kg/kattha)', 'Variety Type',
+    'क्षेत्र', 'प्राङ्गारिक मल (टन/हेक्टर)', 'युरिया (के.जी./कठ्ठा)', 'डिएपी (के.जी./कठ्ठा)', 'पोटास (के.जी./कठ्ठा)', 'जातको प्रकार'
+  ],
+  otherCropsFertilizer: ['Crop', 'Organic Manure (MT/ha)', 'N (kg/ha)', 'P (kg/ha)', 'K (kg/ha)'],
+  optimalPH: ['Crop Category', 'Crop Name', 'Optimal pH Range', 'बाली समूह', 'बालीको नाम', 'उपयुक्त pH दायरा']
+};
+
 // Data Interfaces
 export interface CropCalendarData {
   cropEnglish: string;
@@ -143,6 +260,7 @@ export interface ChemicalFertilizerData {
 
 export interface RegionalFertilizerData {
   crop: string;
+  cropKey: string; // Lowercase crop name for lookups
   region: string;
   varietyType?: string; // For maize (Open/Hybrid)
   compost: string;
@@ -189,12 +307,192 @@ const NEPALI_MONTH_INDICES: { [key: string]: number } = {
   'कात्तिक': 6, 'मंसिर': 7, 'पुस': 8, 'माघ': 9, 'फागुन': 10, 'चैत': 11
 };
 
+// Alternate spellings of Nepali month names found in sowing calendars
+const NEPALI_MONTH_ALIASES: { [key: string]: string[] } = {
+  'वैशाख': ['बैशाख', 'बैसाख'],
+  'जेठ': ['ज्येष्ठ', 'जेष्ठ'],
+  'असार': ['आषाढ', 'असाढ'],
+  'साउन': ['श्रावण', 'सावन'],
+  'भदौ': ['भाद्र', 'भाद्रपद', 'भादौ'],
+  'असोज': ['आश्विन', 'आसोज'],
+  'कात्तिक': ['कार्तिक'],
+  'मंसिर': ['मङ्सिर', 'मार्ग'],
+  'पुस': ['पौष', 'पूस', 'पुष'],
+  'माघ': [],
+  'फागुन': ['फाल्गुन', 'फाल्गुण'],
+  'चैत': ['चैत्र']
+};
+
+// Common romanisations of each month besides the canonical English name
+const ENGLISH_MONTH_ALIASES: { [key: string]: string[] } = {
+  'Baisakh': ['baishakh', 'baishak', 'baisak', 'vaishakh'],
+  'Jestha': ['jeth', 'jeshtha', 'jyestha', 'jesth'],
+  'Ashar': ['asar', 'asadh', 'ashadh', 'asaar', 'aasar'],
+  'Shrawan': ['shravan', 'srawan', 'sawan', 'saun'],
+  'Bhadra': ['bhadau', 'bhado', 'bhadrapad'],
+  'Ashwin': ['ashoj', 'asoj', 'aswin', 'ashvin'],
+  'Kartik': ['kattik', 'karthik', 'kartick'],
+  'Mangsir': ['mangshir', 'mansir', 'marga'],
+  'Poush': ['push', 'paush', 'pous'],
+  'Magh': ['maagh'],
+  'Falgun': ['phagun', 'fagun', 'phalgun'],
+  'Chaitra': ['chait', 'chaita', 'chaitr']
+};
+
+// Every known Nepali spelling paired with its month index
+const NEPALI_MONTH_NAMES: [string, number][] = Object.entries(NEPALI_MONTH_INDICES)
+  .flatMap(([name, idx]) => [name, ...NEPALI_MONTH_ALIASES[name]].map((n): [string, number] => [n, idx]));
+
+// Every known full spelling, Nepali and lowercase English, paired with its month index
+const MONTH_SPELLINGS: [string, number][] = [
+  ...NEPALI_MONTH_NAMES,
+  ...Object.entries(MONTH_MAP_EN_TO_NE).flatMap(([monthEn, monthNe]) =>
+    [monthEn.toLowerCase(), ...ENGLISH_MONTH_ALIASES[monthEn]]
+      .map((n): [string, number] => [n, NEPALI_MONTH_INDICES[monthNe]]))
+];
+
+/**
+ * Exact lookup table from every known month spelling to its month index
+ * Covers all full spellings plus unambiguous 3-letter prefixes of the
+ * English names (e.g. "kar" but not "ash")
+ */
+const MONTH_LOOKUP: Map<string, number> = (() => {
+  const lookup = new Map<string, number>(MONTH_SPELLINGS);
+  const prefixes = new Map<string, number>();
+  const ambiguous = new Set<string>();
+
+  Object.entries(MONTH_MAP_EN_TO_NE).forEach(([monthEn, monthNe]) => {
+    const idx = NEPALI_MONTH_INDICES[monthNe];
+    const prefix = monthEn.toLowerCase().slice(0, 3);
+    if (prefixes.has(prefix) && prefixes.get(prefix) !== idx) ambiguous.add(prefix);
+    prefixes.set(prefix, idx);
+  });
+
+  prefixes.forEach((idx, prefix) => {
+    if (!ambiguous.has(prefix) && !lookup.has(prefix)) lookup.set(prefix, idx);
+  });
+
+  return lookup;
+})();
+
+/**
+ * Helper to split a string into its set of character bigrams
+ * The value is padded with spaces so short names still yield several grams
+ * (जेठ is only 3 UTF-16 units, which would give a single trigram)
+ */
+function bigrams(value: string): Set<string> {
+  const padded = ` ${value} `;
+  const grams = new Set<string>();
+  for (let i = 0; i + 2 <= padded.length; i++) {
+    grams.add(padded.slice(i, i + 2));
+  }
+  return grams;
+}
+
+// A misspelt month is accepted only above this bigram Jaccard similarity and
+// only when it beats the next closest month by the margin, so ambiguous
+// inputs such as "ash" (Ashar or Ashwin) stay unresolved
+const MIN_MONTH_SIMILARITY = 0.3;
+const MIN_MONTH_MARGIN = 0.15;
+
+// Bigram sets for every full month spelling (prefixes excluded)
+const MONTH_BIGRAMS: [Set<string>, number][] = MONTH_SPELLINGS
+  .map(([name, idx]): [Set<string>, number] => [bigrams(name), idx]);
+
+/**
+ * Find the month whose spellings share the most bigrams with a misspelt name
+ * Catches small typos such as "Kartick", "Bhadau" or "जेठो"; real variant
+ * spellings belong in the alias tables instead
+ */
+function fuzzyMonthIndex(name: string): number | undefined {
+  const grams = bigrams(name);
+  const scores = new Array<number>(12).fill(0);
+
+  for (const [monthGrams, idx] of MONTH_BIGRAMS) {
+    let shared = 0;
+    grams.forEach((gram) => {
+      if (monthGrams.has(gram)) shared++;
+    });
+
+    const score = shared / (grams.size + monthGrams.size - shared);
+    if (score > scores[idx]) scores[idx] = score;
+  }
+
+  let bestIdx = 0;
+  scores.forEach((score, idx) => {
+    if (score > scores[bestIdx]) bestIdx = idx;
+  });
+  const runnerUp = Math.max(...scores.filter((_, idx) => idx !== bestIdx));
+
+  if (scores[bestIdx] < MIN_MONTH_SIMILARITY || scores[bestIdx] - runnerUp < MIN_MONTH_MARGIN) {
+    return undefined;
+  }
+  return bestIdx;
+}
+
+/**
+ * Resolve a month name in any known spelling to its Nepali month index
+ * Exact spellings are a single lookup; anything else falls back to bigram matching
+ */
+function resolveMonthIndex(name: string): number | undefined {
+  const key = name.trim().toLowerCase();
+  if (!key) return undefined;
+  return MONTH_LOOKUP.get(key) ?? fuzzyMonthIndex(key);
+}
+
+// Parsed sowing periods keyed by the raw period string; the CSVs only
+// contain a few dozen distinct values, so this stays small
+const PERIOD_MONTHS_CACHE = new Map<string, Set<number> | 'all'>();
+
+/**
+ * Resolve a sowing period string to the set of Nepali month indices it covers
+ */
+function parsePeriodMonths(periodString: string): Set<number> | 'all' {
+  const cached = PERIOD_MONTHS_CACHE.get(periodString);
+  if (cached) return cached;
+
+  let months: Set<number> | 'all';
+
+  // Check for "All Year"
+  if (periodString.includes('बाह्रै महिना') || periodString.toLowerCase().includes('all year')) {
+    months = 'all';
+  } else {
+    months = new Set<number>();
+
+    // Direct match (simple case)
+    for (const [monthNe, idx] of NEPALI_MONTH_NAMES) {
+      if (periodString.includes(monthNe)) months.add(idx);
+    }
+
+    // Range handling: Split by /, , or space to handle multiple ranges usually separated
+    // e.g. "चैत-जेठ / असोज-कात्तिक"
+    for (const range of periodString.split(PERIOD_SEPARATOR_RE)) {
+      const parts = range.trim().split(RANGE_DASH_RE);
+      if (parts.length !== 2) continue;
+
+      const start = resolveMonthIndex(parts[0]);
+      const end = resolveMonthIndex(parts[1]);
+      if (start === undefined || end === undefined) continue;
+
+      // Wrapping ranges e.g. Magh-Baisakh cross the year boundary
+      for (let idx = start; ; idx = (idx + 1) % 12) {
+        months.add(idx);
+        if (idx === end) break;
+      }
+    }
+  }
+
+  PERIOD_MONTHS_CACHE.set(periodString, months);
+  return months;
+}
+
 class CSVParser {
   private static instance: CSVParser;
 
   // Data storage
   private cropCalendarDataEN: CropCalendarData[] = [];
   private cropCalendarDataNE: CropCalendarData[] = []; // Master data source for regions
+  private cropCalendarIndexEN = new Map<string, CropCalendarData>(); // Keyed by lowercase English name
 
   private chemicalFertilizersData: ChemicalFertilizerData[] = [];
   private regionalFertilizerData: RegionalFertilizerData[] = [];
@@ -204,6 +502,10 @@ class CSVParser {
   private isInitialized = false;
   private currentLanguage: 'en' | 'ne' = 'en';
 
+  // Query results are static for a given language, so they are built once
+  private cropsDataCache: CropData[] | null = null;
+  private cropsByMonthCache = new Map<string, CropData[]>();
+
   private constructor() { }
 
   public static getInstance(): CSVParser {
@@ -214,9 +516,15 @@ class CSVParser {
   }
 
   public setLanguage(lang: 'en' | 'ne') {
+    if (lang !== this.currentLanguage) this.clearQueryCache();
     this.currentLanguage = lang;
   }
 
+  private clearQueryCache() {
+    this.cropsDataCache = null;
+    this.cropsByMonthCache.clear();
+  }
+
   // Helper constants
   private readonly HA_TO_ROPANI_FACTOR = 0.050872; // Conversion factor for kg/ha to kg/ropani
 
@@ -225,26 +533,31 @@ class CSVParser {
 
     try {
       // Load ALL files unconditionally
-      const p1 = loadCSVAsset(cropCalendarEN).then(csv => this.cropCalendarDataEN = this.parseCropCalendarEN(parseCSV(csv)));
-      const p2 = loadCSVAsset(cropCalendarNE).then(csv => this.cropCalendarDataNE = this.parseNepaliData(parseCSV(csv)));
+      const p1 = loadParsedCSVAsset(cropCalendarEN, CSV_COLUMNS.cropCalendarEN).then(rows => {
+        this.cropCalendarDataEN = this.parseCropCalendarEN(rows);
+        this.cropCalendarIndexEN = new Map(this.cropCalendarDataEN.map(e => [(e.cropEnglish || '').toLowerCase(), e] as [string, CropCalendarData]));
+      });
+      const p2 = loadParsedCSVAsset(cropCalendarNE, CSV_COLUMNS.cropCalendarNE).then(rows => this.cropCalendarDataNE = this.parseNepaliData(rows));
 
       // Load Fertilizer Data (Using English as source of truth for numbers)
-      const p3 = loadCSVAsset(chemicalFertilizersEN).then(csv => this.chemicalFertilizersData = this.parseChemicalFertilizer(parseCSV(csv)));
+      const p3 = loadParsedCSVAsset(chemicalFertilizersEN, CSV_COLUMNS.chemicalFertilizer).then(rows => this.chemicalFertilizersData = this.parseChemicalFertilizer(rows));
 
-      const p4 = loadCSVAsset(riceFertilizerEN).then(csv => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(parseCSV(csv), 'Rice')));
-      const p5 = loadCSVAsset(maizeFertilizerEN).then(csv => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(parseCSV(csv), 'Maize')));
-      const p6 = loadCSVAsset(wheatFertilizerEN).then(csv => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(parseCSV(csv), 'Wheat')));
+      const p4 = loadParsedCSVAsset(riceFertilizerEN, CSV_COLUMNS.regionalFertilizer).then(rows => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(rows, 'Rice')));
+      const p5 = loadParsedCSVAsset(maizeFertilizerEN, CSV_COLUMNS.regionalFertilizer).then(rows => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(rows, 'Maize')));
+      const p6 = loadParsedCSVAsset(wheatFertilizerEN, CSV_COLUMNS.regionalFertilizer).then(rows => this.regionalFertilizerData.push(...this.parseRegionalFertilizer(rows, 'Wheat')));
 
-      const p7 = loadCSVAsset(otherCropsFertilizerEN).then(csv => this.otherCropsFertilizerData = this.parseOtherCropsFertilizer(parseCSV(csv)));
+      const p7 = loadParsedCSVAsset(otherCropsFertilizerEN, CSV_COLUMNS.otherCropsFertilizer).then(rows => this.otherCropsFertilizerData = this.parseOtherCropsFertilizer(rows));
 
-      const p8 = loadCSVAsset(optimalPHEN).then(csv => this.optimalPHData = this.parseOptimalPH(parseCSV(csv)));
-      const p8_ne = loadCSVAsset(optimalPHNE).then(csv => {
-        if (this.currentLanguage === 'ne') this.optimalPHData = this.parseOptimalPH(parseCSV(csv)); // Use Nepali for strings if active
+      const p8 = loadParsedCSVAsset(optimalPHEN, CSV_COLUMNS.optimalPH).then(rows => this.optimalPHData = this.parseOptimalPH(rows));
+      const p8_ne = loadParsedCSVAsset(optimalPHNE, CSV_COLUMNS.optimalPH).then(rows => {
+        if (this.currentLanguage === 'ne') this.optimalPHData = this.parseOptimalPH(rows); // Use Nepali for strings if active
       });
 
       await Promise.all([p1, p2, p3, p4, p5, p6, p7, p8, p8_ne]);
 
       this.isInitialized = true;
+      this.clearQueryCache();
+      pruneCSVSnapshots();
       console.log('✅ CSV Initialization Complete');
     } catch (error) {
       console.error('❌ Failed to initialize CSV Parser:', error);
@@ -297,8 +610,10 @@ class CSVParser {
   }
 
   private parseRegionalFertilizer(data: any[], cropName: string): RegionalFertilizerData[] {
+    const cropKey = cropName.toLowerCase();
     return data.map(row => ({
       crop: cropName,
+      cropKey,
       region: row['Region'] || row['क्षेत्र'],
       compost: row['Compost/FYM (ton/ha)'] || row['प्राङ्गारिक मल (टन/हेक्टर)'],
       urea: row['Urea (kg/kattha)'] || row['युरिया (के.जी./कठ्ठा)'],
@@ -320,6 +635,7 @@ class CSVParser {
   private parseOtherCropsFertilizer(data: any[]): any[] {
     return data.map(row => ({
       crop: row['Crop'],
+      cropKey: (row['Crop'] || '').toLowerCase(),
       compost: parseFloat(row['Organic Manure (MT/ha)'] || '0'), // MT/ha
       n: parseFloat(row['N (kg/ha)'] || '0'),
       p: parseFloat(row['P (kg/ha)'] || '0'),
@@ -336,50 +652,27 @@ class CSVParser {
   private isMonthInPeriod(monthEn: string, periodString: string): boolean {
     if (!periodString) return false;
 
-    // Check for "All Year"
-    if (periodString.includes('बाह्रै महिना') || periodString.toLowerCase().includes('all year')) {
-      return true;
-    }
+    const months = parsePeriodMonths(periodString);
+    if (months === 'all') return true;
 
-    const monthNe = MONTH_MAP_EN_TO_NE[monthEn];
-    if (!monthNe) return false;
-
-    // Direct match (simple case)
-    if (periodString.includes(monthNe)) return true;
+    const targetIdx = resolveMonthIndex(monthEn);
+    if (targetIdx === undefined) return false;
 
-    // Range handling: Split by /, , or space to handle multiple ranges usually separated
-    // e.g. "चैत-जेठ / असोज-कात्तिक"
-    const ranges = periodString.split(/[\/,]/);
-    const targetIdx = NEPALI_MONTH_INDICES[monthNe];
-
-    return ranges.some(range => {
-      const parts = range.trim().split('-');
-      if (parts.length === 2) {
-        const start = NEPALI_MONTH_INDICES[parts[0].trim()];
-        const end = NEPALI_MONTH_INDICES[parts[1].trim()];
-        if (start !== undefined && end !== undefined) {
-          if (start <= end) {
-            // Standard range e.g. Baisakh-Ashar
-            return targetIdx >= start && targetIdx <= end;
-          } else {
-            // Wrapping range e.g. Magh-Baisakh (Winter to Spring crossing year)
-            return targetIdx >= start || targetIdx <= end;
-          }
-        }
-      }
-      return false;
-    });
+    return months.has(targetIdx);
   }
 
   // Helper to fetch fertilizer info
   private getFertilizerInfo(cropName: string, regionKey: string = 'mid'): { compost: number, n: number, p: number, k: number } {
+    // Crop keys are lowercased at parse time, so only the query needs it here
+    const cropKey = cropName.toLowerCase();
+    const regionSearch = regionKey === 'terai' ? 'Terai' : (regionKey === 'high' ? 'High' : 'Hill');
+
     // 1. Check Regional Data (Rice/Maize/Wheat)
     // Filter matching crop
-    const regionalMatches = this.regionalFertilizerData.filter(rf => rf.crop.toLowerCase().includes(cropName.toLowerCase()));
+    const regionalMatches = this.regionalFertilizerData.filter(rf => rf.cropKey.includes(cropKey));
 
     if (regionalMatches.length > 0) {
       // Filter by region keyword
-      const regionSearch = regionKey === 'terai' ? 'Terai' : (regionKey === 'high' ? 'High' : 'Hill');
       const matches = regionalMatches.filter(rf => rf.region.includes(regionSearch) || (regionSearch === 'Hill' && rf.region.includes('Mid')));
 
       if (matches.length > 0) {
@@ -404,12 +697,11 @@ class CSVParser {
     const matches = this.otherCropsFertilizerData.filter(oc =>
       // oc.crop like "Tomato - Terai Irrigated"
       // cropName like "Tomato"
-      oc.crop.toLowerCase().includes(cropName.toLowerCase())
+      oc.cropKey.includes(cropKey)
     );
 
     if (matches.length > 0) {
       // Filter by region if possible
-      const regionSearch = regionKey === 'terai' ? 'Terai' : (regionKey === 'high' ? 'High' : 'Hill');
       let regionalMatch = matches.find(m => m.crop.includes(regionSearch));
 
       const bestMatch = regionalMatch || matches[0];
@@ -430,6 +722,8 @@ class CSVParser {
    * Combines all regional information for a single crop
    */
   public getCropsData(): CropData[] {
+    if (this.cropsDataCache) return this.cropsDataCache;
+
     const cropMap = new Map<string, CropData>();
     const isNe = this.currentLanguage === 'ne';
 
@@ -444,7 +738,7 @@ class CSVParser {
       if (!entry) {
         // Initialize entry
         // Try to find matching English data for detailed remarks if in English mode
-        const enData = this.cropCalendarDataEN.find(e => e.cropEnglish.toLowerCase() === key);
+        const enData = this.cropCalendarIndexEN.get(key);
 
         let characteristics = '';
         let adaptation = '';
@@ -492,7 +786,8 @@ class CSVParser {
       if (row.region === 'तराई') entry.teraiSowing = row.plantingMonths;
     });
 
-    return Array.from(cropMap.values());
+    this.cropsDataCache = Array.from(cropMap.values());
+    return this.cropsDataCache;
   }
 
   /**
@@ -503,6 +798,10 @@ class CSVParser {
     monthBaseEn: string,
     regionKey: "high" | "mid" | "terai" = "mid"
   ): CropData[] {
+    const cacheKey = `${regionKey}:${monthBaseEn}`;
+    const cached = this.cropsByMonthCache.get(cacheKey);
+    if (cached) return cached;
+
     const isNe = this.currentLanguage === 'ne';
     const targetRegionNe = REGION_MAP_EN_TO_NE[regionKey];
 
@@ -518,9 +817,9 @@ class CSVParser {
     });
 
     // Map to Legacy CropData format
-    return filtered.map((row, index) => {
+    const crops = filtered.map((row, index) => {
       // Find english data for details if needed
-      const enData = this.cropCalendarDataEN.find(e => e.cropEnglish.toLowerCase() === (row.cropEnglish || '').toLowerCase());
+      const enData = this.cropCalendarIndexEN.get((row.cropEnglish || '').toLowerCase());
 
       let characteristics = '';
       let adaptation = '';
@@ -563,6 +862,9 @@ class CSVParser {
         remarks: remarks || (isNe ? 'विवरण उपलब्ध छैन।' : 'No detailed info available.')
       };
     });
+
+    this.cropsByMonthCache.set(cacheKey, crops);
+    return crops;
   }
 
   public searchCrops(query: string): CropData[] {
@@ -421,33 +421,35 @@ export const formatUnit = (value: number, unit: string): string => {
   return `${value.toFixed(2)} ${unit}`;
 };
 
+// Approximate Gregorian start date of each Nepali month, in calendar order
+const NEPALI_MONTH_STARTS = [
+  { month: 0, day: 14, nepali: "Magh" }, // Jan 14
+  { month: 1, day: 13, nepali: "Falgun" }, // Feb 13
+  { month: 2, day: 14, nepali: "Chaitra" }, // Mar 14
+  { month: 3, day: 14, nepali: "Baisakh" }, // Apr 14
+  { month: 4, day: 15, nepali: "Jestha" }, // May 15
+  { month: 5, day: 15, nepali: "Ashar" }, // Jun 15
+  { month: 6, day: 17, nepali: "Shrawan" }, // Jul 17
+  { month: 7, day: 17, nepali: "Bhadra" }, // Aug 17
+  { month: 8, day: 17, nepali: "Ashwin" }, // Sep 17
+  { month: 9, day: 18, nepali: "Kartik" }, // Oct 18
+  { month: 10, day: 17, nepali: "Mangsir" }, // Nov 17
+  { month: 11, day: 16, nepali: "Poush" }, // Dec 16
+].map((point) => ({ ...point, ordinal: point.month * 100 + point.day }));
+
 export const getCurrentNepaliMonth = (): string => {
   const today = new Date();
-  const checkpoints = [
-    { month: 0, day: 14, nepali: "Magh" }, // Jan 14
-    { month: 1, day: 13, nepali: "Falgun" }, // Feb 13
-    { month: 2, day: 14, nepali: "Chaitra" }, // Mar 14
-    { month: 3, day: 14, nepali: "Baisakh" }, // Apr 14
-    { month: 4, day: 15, nepali: "Jestha" }, // May 15
-    { month: 5, day: 15, nepali: "Ashar" }, // Jun 15
-    { month: 6, day: 17, nepali: "Shrawan" }, // Jul 17
-    { month: 7, day: 17, nepali: "Bhadra" }, // Aug 17
-    { month: 8, day: 17, nepali: "Ashwin" }, // Sep 17
-    { month: 9, day: 18, nepali: "Kartik" }, // Oct 18
-    { month: 10, day: 17, nepali: "Mangsir" }, // Nov 17
-    { month: 11, day: 16, nepali: "Poush" }, // Dec 16
-  ];
-
-  const { month, day } = { month: today.getMonth(), day: today.getDate() };
-  let current = checkpoints[checkpoints.length - 1].nepali;
+  const ordinal = today.getMonth() * 100 + today.getDate();
 
-  checkpoints.forEach((point) => {
-    if (month > point.month || (month === point.month && day >= point.day)) {
-      current = point.nepali;
+  // Latest month start on or before today
+  for (let i = NEPALI_MONTH_STARTS.length - 1; i >= 0; i--) {
+    if (ordinal >= NEPALI_MONTH_STARTS[i].ordinal) {
+      return NEPALI_MONTH_STARTS[i].nepali;
     }
-  });
+  }
 
-  return current;
+  // Early January is still Poush from the previous year
+  return NEPALI_MONTH_STARTS[NEPALI_MONTH_STARTS.length - 1].nepali;
 };
 
 export const getGreeting = (): string => {
@@ -99,6 +99,59 @@ export class ImageUtils {
     }
   }
 
+  /**
+   * Downscales an image so its longer side fits within maxDimension
+   * Aspect ratio is preserved and images already small enough are returned as-is.
+   * The result is a file URI only; no base64 copy is produced.
+   * @param image - URI and dimensions of the source image
+   * @param maxDimension - Maximum width or height in pixels (default: 1024)
+   * @param compress - JPEG compression quality (0-1)
+   * @returns Promise<ProcessedImage> - Downscaled image information
+   */
+  static async downscaleForUpload(
+    image: ProcessedImage,
+    maxDimension: number = 1024,
+    compress: number = 0.7,
+  ): Promise<ProcessedImage> {
+    const { width, height } = image;
+    if (!width || !height || Math.max(width, height) <= maxDimension) {
+      return image;
+    }
+
+    // Resizing only the longer side lets the manipulator keep the aspect ratio
+    const resize = width >= height ? { width: maxDimension } : { height: maxDimension };
+
+    try {
+      const result = await manipulateAsync(image.uri, [{ resize }], {
+        compress,
+        format: SaveFormat.JPEG,
+      });
+
+      return {
+        uri: result.uri,
+        width: result.width,
+        height: result.height,
+      };
+    } catch (error) {
+      console.warn("Failed to downscale image, using original:", error);
+      return image;
+    }
+  }
+
+  /**
+   * Computes a content signature (MD5) for an image file
+   * @param imageUri - URI of the image file
+   * @returns Promise<string | null> - MD5 hex digest, or null if unavailable
+   */
+  static async getImageSignature(imageUri: string): Promise<string | null> {
+    try {
+      const info = await FileSystem.getInfoAsync(imageUri, { md5: true });
+      return info.exists && info.md5 ? info.md5 : null;
+    } catch {
+      return null;
+    }
+  }
+
   /**
    * Converts a base64 string to a temporary file URI
    * @param base64String - Base64 encoded image data